@@ -1,8 +1,20 @@
 """Pulumi infrastructure for Humanoid Robot Insurance Platform."""
 
+import base64
+import json
+
 import pulumi
-import pulumi_azure_native as azure_native
 from pulumi import Config, Output
+from pulumi_azure_native import (
+    app,
+    authorization,
+    containerregistry,
+    dbforpostgresql,
+    insights,
+    keyvault,
+    operationalinsights,
+    resources,
+)
 
 # Configuration
 config = Config()
@@ -11,6 +23,7 @@ environment = config.get("environment") or "dev"
 location = config.get("azure-native:region") or "East US"
 postgres_admin_login = config.get("postgresAdminLogin") or "adminuser"
 postgres_admin_password = config.require_secret("postgresAdminPassword")
+app_secret_key = config.require_secret("appSecretKey")
 
 # Resource naming
 resource_prefix = f"{app_name}-{environment}"
@@ -22,27 +35,31 @@ log_analytics_name = f"{resource_prefix}-logs"
 app_insights_name = f"{resource_prefix}-insights"
 container_app_env_name = f"{resource_prefix}-env"
 
+# Azure client configuration, resolved once per program evaluation rather
+# than inline on every resource that needs the tenant id.
+client_config = authorization.get_client_config()
+
 # Resource Group
-resource_group = azure_native.resources.ResourceGroup(
+resource_group = resources.ResourceGroup(
     "rg",
     resource_group_name=f"rg-{resource_prefix}",
     location=location
 )
 
 # Log Analytics Workspace
-log_analytics = azure_native.operationalinsights.Workspace(
+log_analytics = operationalinsights.Workspace(
     "log-analytics",
     resource_group_name=resource_group.name,
     workspace_name=log_analytics_name,
     location=location,
-    sku=azure_native.operationalinsights.WorkspaceSkuArgs(
+    sku=operationalinsights.WorkspaceSkuArgs(
         name="PerGB2018"
     ),
     retention_in_days=30
 )
 
 # Application Insights
-app_insights = azure_native.insights.Component(
+app_insights = insights.Component(
     "app-insights",
     resource_group_name=resource_group.name,
     resource_name=app_insights_name,
@@ -53,44 +70,44 @@ app_insights = azure_native.insights.Component(
 )
 
 # Container Registry
-container_registry = azure_native.containerregistry.Registry(
+container_registry = containerregistry.Registry(
     "container-registry",
     resource_group_name=resource_group.name,
     registry_name=container_registry_name,
     location=location,
-    sku=azure_native.containerregistry.SkuArgs(
+    sku=containerregistry.SkuArgs(
         name="Basic"
     ),
     admin_user_enabled=True
 )
 
 # PostgreSQL Flexible Server
-postgres_server = azure_native.dbforpostgresql.Server(
+postgres_server = dbforpostgresql.Server(
     "postgres-server",
     resource_group_name=resource_group.name,
     server_name=postgres_server_name,
     location=location,
-    sku=azure_native.dbforpostgresql.SkuArgs(
+    sku=dbforpostgresql.SkuArgs(
         name="Standard_B1ms",
         tier="Burstable"
     ),
     administrator_login=postgres_admin_login,
     administrator_login_password=postgres_admin_password,
     version="15",
-    storage=azure_native.dbforpostgresql.StorageArgs(
+    storage=dbforpostgresql.StorageArgs(
         storage_size_gb=32
     ),
-    backup=azure_native.dbforpostgresql.BackupArgs(
+    backup=dbforpostgresql.BackupArgs(
         backup_retention_days=7,
         geo_redundant_backup="Disabled"
     ),
-    high_availability=azure_native.dbforpostgresql.HighAvailabilityArgs(
+    high_availability=dbforpostgresql.HighAvailabilityArgs(
         mode="Disabled"
     )
 )
 
 # PostgreSQL Database
-postgres_database = azure_native.dbforpostgresql.Database(
+postgres_database = dbforpostgresql.Database(
     "postgres-database",
     resource_group_name=resource_group.name,
     server_name=postgres_server.name,
@@ -100,7 +117,7 @@ postgres_database = azure_native.dbforpostgresql.Database(
 )
 
 # PostgreSQL Firewall Rule (Allow Azure Services)
-postgres_firewall_rule = azure_native.dbforpostgresql.FirewallRule(
+postgres_firewall_rule = dbforpostgresql.FirewallRule(
     "postgres-firewall-rule",
     resource_group_name=resource_group.name,
     server_name=postgres_server.name,
@@ -109,139 +126,163 @@ postgres_firewall_rule = azure_native.dbforpostgresql.FirewallRule(
     end_ip_address="0.0.0.0"
 )
 
+# Shared Output values resolved once so dependent resources fan in on a
+# single node instead of forming apply-chains that serialize creation.
+log_analytics_shared_key = log_analytics.get_shared_keys().apply(
+    lambda keys: keys.primary_shared_key
+)
+database_url = Output.format(
+    "postgresql://{0}:{1}@{2}:5432/humanoid_robot_insurance",
+    postgres_admin_login,
+    postgres_admin_password,
+    postgres_server.fully_qualified_domain_name
+)
+
 # Key Vault
-key_vault = azure_native.keyvault.Vault(
+key_vault = keyvault.Vault(
     "key-vault",
     resource_group_name=resource_group.name,
     vault_name=key_vault_name,
     location=location,
-    properties=azure_native.keyvault.VaultPropertiesArgs(
-        sku=azure_native.keyvault.SkuArgs(
+    properties=keyvault.VaultPropertiesArgs(
+        sku=keyvault.SkuArgs(
             family="A",
             name="standard"
         ),
-        tenant_id=azure_native.authorization.get_client_config().tenant_id,
+        tenant_id=client_config.tenant_id,
         access_policies=[],
         enable_rbac_authorization=True
     )
 )
 
+# Application secret key, kept in Key Vault as the canonical store so
+# rotations happen there instead of through redeployed literals.
+app_secret_key_secret = keyvault.Secret(
+    "app-secret-key",
+    resource_group_name=resource_group.name,
+    vault_name=key_vault.name,
+    secret_name="app-secret-key",
+    properties=keyvault.SecretPropertiesArgs(
+        value=app_secret_key
+    )
+)
+
 # Container Apps Environment
-container_app_env = azure_native.app.ManagedEnvironment(
+container_app_env = app.ManagedEnvironment(
     "container-app-env",
     resource_group_name=resource_group.name,
     environment_name=container_app_env_name,
     location=location,
-    app_logs_configuration=azure_native.app.AppLogsConfigurationArgs(
+    app_logs_configuration=app.AppLogsConfigurationArgs(
         destination="log-analytics",
-        log_analytics_configuration=azure_native.app.LogAnalyticsConfigurationArgs(
+        log_analytics_configuration=app.LogAnalyticsConfigurationArgs(
             customer_id=log_analytics.customer_id,
-            shared_key=log_analytics.get_shared_keys().apply(lambda keys: keys.primary_shared_key)
+            shared_key=log_analytics_shared_key
         )
     )
 )
 
-# Container App
-container_app = azure_native.app.ContainerApp(
-    "container-app",
-    resource_group_name=resource_group.name,
-    container_app_name=container_app_name,
-    location=location,
-    managed_environment_id=container_app_env.id,
-    configuration=azure_native.app.ConfigurationArgs(
-        ingress=azure_native.app.IngressArgs(
+def _encode_app_config(db_url, secret_key, vault_uri, app_insights_connection):
+    """Base64-encode the consolidated application config secret."""
+    return base64.b64encode(
+        json.dumps(
+            {
+                "DATABASE_URL": db_url,
+                "SECRET_KEY": secret_key,
+                "AZURE_KEYVAULT_URL": vault_uri,
+                "AZURE_APPLICATION_INSIGHTS_CONNECTION_STRING": app_insights_connection,
+            }
+        ).encode()
+    ).decode()
+
+
+# Container App configuration, built from a single Output.all over every
+# async input (Postgres, Key Vault, App Insights, ACR). The four upstream
+# resources have no edges between them, so Pulumi creates them in
+# parallel and the Container App waits once for the whole set. The
+# application config is consolidated into one base64 secret so each
+# deploy writes one ARM secret instead of four; the app decodes
+# APP_CONFIG_B64 at startup (see src/core/config.py).
+container_app_configuration = Output.all(
+    database_url,
+    app_secret_key,
+    key_vault.properties,
+    app_insights.connection_string,
+    container_registry.login_server,
+    container_registry.name
+).apply(
+    lambda vals: app.ConfigurationArgs(
+        ingress=app.IngressArgs(
             external=True,
             target_port=8000,
             allow_insecure=False,
             traffic=[
-                azure_native.app.TrafficWeightArgs(
+                app.TrafficWeightArgs(
                     latest_revision=True,
                     weight=100
                 )
             ]
         ),
         secrets=[
-            azure_native.app.SecretArgs(
-                name="database-url",
-                value=Output.concat(
-                    "postgresql://",
-                    postgres_admin_login,
-                    ":",
-                    postgres_admin_password,
-                    "@",
-                    postgres_server.fully_qualified_domain_name,
-                    ":5432/humanoid_robot_insurance"
-                )
-            ),
-            azure_native.app.SecretArgs(
-                name="secret-key",
-                value="your-secret-key-here"  # This should be generated or provided securely
-            ),
-            azure_native.app.SecretArgs(
-                name="keyvault-url",
-                value=key_vault.properties.apply(lambda props: props.vault_uri)
-            ),
-            azure_native.app.SecretArgs(
-                name="app-insights-connection-string",
-                value=app_insights.connection_string
+            app.SecretArgs(
+                name="app-config",
+                value=_encode_app_config(vals[0], vals[1], vals[2].vault_uri, vals[3])
             )
         ],
         registries=[
-            azure_native.app.RegistryCredentialsArgs(
-                server=container_registry.login_server,
-                username=container_registry.name,
+            app.RegistryCredentialsArgs(
+                server=vals[4],
+                username=vals[5],
                 password_secret_ref="registry-password"
             )
         ]
-    ),
-    template=azure_native.app.TemplateArgs(
+    )
+)
+
+# Container App
+container_app = app.ContainerApp(
+    "container-app",
+    resource_group_name=resource_group.name,
+    container_app_name=container_app_name,
+    location=location,
+    managed_environment_id=container_app_env.id,
+    configuration=container_app_configuration,
+    template=app.TemplateArgs(
         containers=[
-            azure_native.app.ContainerArgs(
+            app.ContainerArgs(
                 name="humanoid-robot-insurance",
                 image=Output.concat(
                     container_registry.login_server,
                     "/humanoid-robot-insurance:latest"
                 ),
-                resources=azure_native.app.ContainerResourcesArgs(
+                resources=app.ContainerResourcesArgs(
                     cpu=0.5,
                     memory="1Gi"
                 ),
                 env=[
-                    azure_native.app.EnvironmentVarArgs(
-                        name="DATABASE_URL",
-                        secret_ref="database-url"
+                    app.EnvironmentVarArgs(
+                        name="APP_CONFIG_B64",
+                        secret_ref="app-config"
                     ),
-                    azure_native.app.EnvironmentVarArgs(
-                        name="SECRET_KEY",
-                        secret_ref="secret-key"
-                    ),
-                    azure_native.app.EnvironmentVarArgs(
-                        name="AZURE_KEYVAULT_URL",
-                        secret_ref="keyvault-url"
-                    ),
-                    azure_native.app.EnvironmentVarArgs(
-                        name="AZURE_APPLICATION_INSIGHTS_CONNECTION_STRING",
-                        secret_ref="app-insights-connection-string"
-                    ),
-                    azure_native.app.EnvironmentVarArgs(
+                    app.EnvironmentVarArgs(
                         name="ENVIRONMENT",
                         value=environment
                     )
                 ],
                 probes=[
-                    azure_native.app.ContainerAppProbeArgs(
+                    app.ContainerAppProbeArgs(
                         type="Liveness",
-                        http_get=azure_native.app.ContainerAppProbeHttpGetArgs(
+                        http_get=app.ContainerAppProbeHttpGetArgs(
                             path="/health",
                             port=8000
                         ),
                         initial_delay_seconds=30,
                         period_seconds=30
                     ),
-                    azure_native.app.ContainerAppProbeArgs(
+                    app.ContainerAppProbeArgs(
                         type="Readiness",
-                        http_get=azure_native.app.ContainerAppProbeHttpGetArgs(
-                            path="/health",
+                        http_get=app.ContainerAppProbeHttpGetArgs(
+                            path="/ready",
                             port=8000
                         ),
                         initial_delay_seconds=5,
@@ -250,13 +291,13 @@ container_app = azure_native.app.ContainerApp(
                 ]
             )
         ],
-        scale=azure_native.app.ScaleArgs(
+        scale=app.ScaleArgs(
             min_replicas=1,
             max_replicas=10,
             rules=[
-                azure_native.app.ScaleRuleArgs(
+                app.ScaleRuleArgs(
                     name="http-scaling",
-                    http=azure_native.app.HttpScaleRuleArgs(
+                    http=app.HttpScaleRuleArgs(
                         metadata={
                             "concurrentRequests": "10"
                         }
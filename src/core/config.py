@@ -1,10 +1,35 @@
 """Application configuration management."""
 
-from functools import lru_cache
-from typing import Optional
+import base64
+import json
+import os
+from typing import Any, Dict, Optional, Tuple, Type
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, model_validator
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+
+class AppConfigSource(PydanticBaseSettingsSource):
+    """Settings source decoding the APP_CONFIG_B64 deployment blob.
+
+    The infrastructure layer consolidates secrets into a single base64
+    encoded JSON document so each deploy writes one secret instead of one
+    per value. Keys in the blob match the environment variable aliases.
+    """
+
+    def get_field_value(self, field: Any, field_name: str) -> Tuple[Any, str, bool]:
+        # Values are produced wholesale in __call__; per-field lookup unused.
+        return None, field_name, False
+
+    def __call__(self) -> Dict[str, Any]:
+        raw = os.environ.get("APP_CONFIG_B64")
+        if not raw:
+            return {}
+        return json.loads(base64.b64decode(raw))
 
 
 class Settings(BaseSettings):
@@ -14,7 +39,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
     
     # Application
@@ -25,6 +51,9 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = Field(alias="DATABASE_URL")
+    # Escape hatch for deployments where migrations own the schema; until
+    # then every environment keeps creating tables at startup.
+    run_ddl_on_startup: bool = Field(default=True, alias="RUN_DDL_ON_STARTUP")
     
     # Security
     secret_key: str = Field(alias="SECRET_KEY")
@@ -61,23 +90,55 @@ class Settings(BaseSettings):
         alias="AZURE_APPLICATION_INSIGHTS_CONNECTION_STRING"
     )
     
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Read the deployment config blob after explicit environment variables."""
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            AppConfigSource(settings_cls),
+            file_secret_settings,
+        )
+
+    @model_validator(mode="after")
+    def _cache_environment_flags(self) -> "Settings":
+        """Precompute environment flags once; the model is frozen after load."""
+        env = self.environment.lower()
+        object.__setattr__(self, "_is_production", env == "production")
+        object.__setattr__(self, "_is_development", env == "development")
+        object.__setattr__(self, "_is_testing", env == "testing")
+        return self
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment.lower() == "production"
-    
+        return self._is_production
+
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment.lower() == "development"
-    
+        return self._is_development
+
     @property
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
-        return self.environment.lower() == "testing"
+        return self._is_testing
+
+
+# Module-level singleton: settings are loaded once at import time, so the
+# per-request dependency resolves to a plain attribute load instead of an
+# lru_cache dispatch.
+settings: Settings = Settings()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
\ No newline at end of file
+    """Get the application settings singleton."""
+    return settings
\ No newline at end of file
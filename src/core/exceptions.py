@@ -1,11 +1,22 @@
 """Custom exception classes for the application."""
 
+import re
 from typing import Any, Dict, Optional
 
 
 class BaseCustomException(Exception):
     """Base exception class for custom exceptions."""
-    
+
+    __slots__ = ("message", "error_code", "details")
+
+    default_error_code = "CUSTOM_ERROR"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive a default error code from the class name at class creation."""
+        super().__init_subclass__(**kwargs)
+        name = cls.__name__.removesuffix("Error")
+        cls.default_error_code = re.sub(r"(?<!^)(?=[A-Z])", "_", name).upper()
+
     def __init__(
         self,
         message: str,
@@ -13,100 +24,100 @@ class BaseCustomException(Exception):
         details: Optional[Dict[str, Any]] = None
     ):
         self.message = message
-        self.error_code = error_code
+        self.error_code = error_code or self.default_error_code
         self.details = details or {}
         super().__init__(self.message)
 
 
 class ValidationError(BaseCustomException):
     """Raised when input validation fails."""
-    pass
+    __slots__ = ()
 
 
 class NotFoundError(BaseCustomException):
     """Raised when a requested resource is not found."""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(BaseCustomException):
     """Raised when authentication fails."""
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(BaseCustomException):
     """Raised when authorization fails."""
-    pass
+    __slots__ = ()
 
 
 class BusinessLogicError(BaseCustomException):
     """Raised when business logic validation fails."""
-    pass
+    __slots__ = ()
 
 
 class ExternalServiceError(BaseCustomException):
     """Raised when external service calls fail."""
-    pass
+    __slots__ = ()
 
 
 class DatabaseError(BaseCustomException):
     """Raised when database operations fail."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(BaseCustomException):
     """Raised when configuration is invalid."""
-    pass
+    __slots__ = ()
 
 
 # Robot-specific exceptions
 class RobotNotFoundError(NotFoundError):
     """Raised when a robot is not found."""
-    pass
+    __slots__ = ()
 
 
 class InvalidRobotSpecificationError(ValidationError):
     """Raised when robot specifications are invalid."""
-    pass
+    __slots__ = ()
 
 
 # Policy-specific exceptions
 class PolicyNotFoundError(NotFoundError):
     """Raised when a policy is not found."""
-    pass
+    __slots__ = ()
 
 
 class PolicyValidationError(ValidationError):
     """Raised when policy validation fails."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientCoverageError(BusinessLogicError):
     """Raised when coverage is insufficient for the request."""
-    pass
+    __slots__ = ()
 
 
 # Claims-specific exceptions
 class ClaimNotFoundError(NotFoundError):
     """Raised when a claim is not found."""
-    pass
+    __slots__ = ()
 
 
 class InvalidClaimStatusError(BusinessLogicError):
     """Raised when claim status transition is invalid."""
-    pass
+    __slots__ = ()
 
 
 class ClaimProcessingError(BusinessLogicError):
     """Raised when claim processing fails."""
-    pass
+    __slots__ = ()
 
 
 # Risk assessment exceptions
 class RiskAssessmentError(BusinessLogicError):
     """Raised when risk assessment fails."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientDataError(ValidationError):
     """Raised when insufficient data is provided for processing."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
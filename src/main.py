@@ -1,80 +1,134 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from src.core.config import get_settings
+from src.core.config import settings
 from src.core.database import create_tables
 from src.core.exceptions import BaseCustomException
 
+try:  # pragma: no cover - optional accelerated event loop
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup
-    create_tables()
+    # Startup: run DDL in a worker thread so the process answers /health
+    # immediately instead of blocking on the database round trip.
+    # RUN_DDL_ON_STARTUP=false lets deployments whose schema is managed by
+    # migrations skip the per-pod-start DDL round trip entirely.
+    if settings.run_ddl_on_startup:
+        app.state.db_ready = asyncio.create_task(asyncio.to_thread(create_tables))
+    else:
+        db_ready = asyncio.get_running_loop().create_future()
+        db_ready.set_result(None)
+        app.state.db_ready = db_ready
     yield
     # Shutdown
     pass
 
 
+async def custom_exception_handler(request, exc: BaseCustomException):
+    """Translate custom exceptions into JSON error responses."""
+    return ORJSONResponse(
+        status_code=400,
+        content={
+            "error": exc.error_code,
+            "message": exc.message,
+            "details": exc.details,
+        },
+    )
+
+
+# Both bodies are fully determined by startup settings, so serialize them
+# once at import instead of building and encoding a dict per request.
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": settings.app_name,
+        "version": settings.version,
+        "environment": settings.environment,
+    }
+)
+_READY_BODY = orjson.dumps(
+    {
+        "status": "ready",
+        "service": settings.app_name,
+        "version": settings.version,
+        "environment": settings.environment,
+    }
+)
+_ROOT_BODY = orjson.dumps(
+    {
+        "message": "Welcome to the Humanoid Robot Insurance Platform",
+        "version": settings.version,
+        "docs": "/docs",
+    }
+)
+
+
+async def health_check():
+    """Health check endpoint."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+async def readiness_check(request: Request):
+    """Readiness endpoint; resolves once startup database work is done."""
+    await request.app.state.db_ready
+    return Response(content=_READY_BODY, media_type="application/json")
+
+
+async def root():
+    """Root endpoint."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    settings = get_settings()
-    
     app = FastAPI(
         title=settings.app_name,
         version=settings.version,
         description="Comprehensive insurance services for humanoid robots",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        # In production drop the whole OpenAPI subsystem, not just the doc
+        # pages: with openapi_url=None the schema is never generated.
+        openapi_url="/openapi.json" if not settings.is_production else None,
         docs_url="/docs" if not settings.is_production else None,
         redoc_url="/redoc" if not settings.is_production else None,
     )
     
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if settings.is_development else [],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    
-    # Exception handlers
-    @app.exception_handler(BaseCustomException)
-    async def custom_exception_handler(request, exc: BaseCustomException):
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error": exc.error_code or "CUSTOM_ERROR",
-                "message": exc.message,
-                "details": exc.details,
-            },
+    # Add CORS middleware only when there are origins to allow; with an
+    # empty origin list the middleware would block everything while still
+    # running for every request.
+    allow_origins = ["*"] if settings.is_development else []
+    if allow_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=allow_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
         )
     
-    # Health check endpoint
-    @app.get("/health")
-    async def health_check():
-        """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": settings.app_name,
-            "version": settings.version,
-            "environment": settings.environment,
-        }
-    
-    # Root endpoint
-    @app.get("/")
-    async def root():
-        """Root endpoint."""
-        return {
-            "message": "Welcome to the Humanoid Robot Insurance Platform",
-            "version": settings.version,
-            "docs": "/docs",
-        }
-    
+    # Exception handlers
+    app.add_exception_handler(BaseCustomException, custom_exception_handler)
+
+    # Endpoints
+    app.add_api_route("/health", health_check, methods=["GET"])
+    app.add_api_route("/ready", readiness_check, methods=["GET"])
+    app.add_api_route("/", root, methods=["GET"])
+
     return app
 
 
@@ -1,17 +1,39 @@
 """Policy entity models and schemas."""
 
 from datetime import datetime, date
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from enum import Enum
 from typing import Dict, Any, Optional, List
 from uuid import UUID, uuid4
 import re
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from sqlalchemy import Column, String, DateTime, JSON, Text, Enum as SQLEnum, Numeric, Date, Boolean
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator, model_validator
+from sqlalchemy import Column, String, DateTime, JSON, Text, CheckConstraint, Index, Numeric, Date, Boolean, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from src.core.database import Base
+from src.models.types import NonEmptyStrList
+
+# Validator patterns, compiled once at import instead of through re's
+# per-call cache lookup.
+_CUSTOMER_ID_RE = re.compile(r'^[A-Za-z0-9\-_]+$')
+_JURISDICTION_RE = re.compile(r'^[A-Z]{2,3}(-[A-Z]{2,3})?$')
+
+_CENT = Decimal('0.01')
+
+
+def _is_cent_precise(v: Decimal) -> bool:
+    """Return True when ``v`` has at most two decimal places.
+
+    The quantize comparison works on coefficients in C, avoiding the
+    DecimalTuple allocation ``as_tuple()`` performs per check.
+    """
+    try:
+        return v == v.quantize(_CENT)
+    except InvalidOperation:
+        # Quantize overflows context precision only for astronomically
+        # large values, which are not valid currency amounts either.
+        return False
 
 
 class CoverageType(str, Enum):
@@ -24,6 +46,13 @@ class CoverageType(str, Enum):
     COMPREHENSIVE = "comprehensive"
 
 
+# One bit per coverage type: duplicate and comprehensive-exclusivity
+# checks over a list collapse to integer bitwise ops, with no set
+# allocation or hashing per element.
+_COVERAGE_BITS = {ct: 1 << i for i, ct in enumerate(CoverageType)}
+_COMPREHENSIVE_BIT = _COVERAGE_BITS[CoverageType.COMPREHENSIVE]
+
+
 class PolicyStatus(str, Enum):
     """Policy status enumeration."""
     DRAFT = "draft"
@@ -50,6 +79,21 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Underwriting thresholds, built once at import so validators do not
+# re-parse Decimal literals or rebuild the minimum-premium table per
+# instance.
+_MIN_PREMIUMS = {
+    RiskLevel.LOW: Decimal('100'),
+    RiskLevel.MEDIUM: Decimal('250'),
+    RiskLevel.HIGH: Decimal('500'),
+    RiskLevel.CRITICAL: Decimal('1000'),
+}
+_PREMIUM_CAP = Decimal('0.2')
+_DEDUCTIBLE_CAP = Decimal('0.5')
+_MIN_TERM_DAYS = 30
+_MAX_TERM_DAYS = 1825  # 5 years
+
+
 # SQLAlchemy Model
 class Policy(Base):
     """Policy database model."""
@@ -60,31 +104,71 @@ class Policy(Base):
     policy_number = Column(String(50), unique=True, nullable=False)
     robot_id = Column(PGUUID(as_uuid=True), nullable=False)
     customer_id = Column(String(255), nullable=False)
-    coverage_types = Column(JSON, nullable=False)  # List of coverage types
+    coverage_types = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)  # List of coverage types
     premium_amount = Column(Numeric(10, 2), nullable=False)
     deductible_amount = Column(Numeric(10, 2), nullable=False)
     coverage_limit = Column(Numeric(12, 2), nullable=False)
     effective_date = Column(Date, nullable=False)
     expiration_date = Column(Date, nullable=False)
-    status = Column(SQLEnum(PolicyStatus), default=PolicyStatus.DRAFT)
-    payment_frequency = Column(SQLEnum(PaymentFrequency), default=PaymentFrequency.ANNUAL)
-    risk_level = Column(SQLEnum(RiskLevel), nullable=False)
-    terms_and_conditions = Column(JSON, nullable=False)
+    # Enum-valued columns are stored as plain strings with DB-level CHECK
+    # constraints: SQLAlchemy's Enum type runs a Python conversion
+    # callback per row per column on fetch, which adds up on paginated
+    # reads. The Pydantic response schemas coerce back to Enum members.
+    status = Column(String(32), default=PolicyStatus.DRAFT.value)
+    payment_frequency = Column(String(32), default=PaymentFrequency.ANNUAL.value)
+    risk_level = Column(String(32), nullable=False)
+    terms_and_conditions = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
     underwriter_notes = Column(Text, nullable=True)
     auto_renewal = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('draft','active','suspended','cancelled','expired','pending_renewal')",
+            name='ck_policies_status',
+        ),
+        CheckConstraint(
+            "payment_frequency IN ('monthly','quarterly','semi_annual','annual')",
+            name='ck_policies_payment_frequency',
+        ),
+        CheckConstraint(
+            "risk_level IN ('low','medium','high','critical')",
+            name='ck_policies_risk_level',
+        ),
+        # Listing endpoints filter by customer (optionally with status),
+        # robot lookups join on robot_id, and the expiring-soon job scans
+        # by expiration_date; without these every query is a seq scan.
+        Index('ix_policies_customer_status', 'customer_id', 'status'),
+        Index('ix_policies_robot_id', 'robot_id'),
+        Index('ix_policies_expiration_date', 'expiration_date'),
+        # GIN over the JSONB coverage list so "policies covering X"
+        # membership queries are index-only on Postgres.
+        Index('ix_policies_coverage_types_gin', 'coverage_types', postgresql_using='gin'),
+    )
+
+    @classmethod
+    def bulk_insert(cls, session, records: List[Dict[str, Any]]) -> None:
+        """Insert many policy rows through insertmanyvalues.
+
+        Routes around per-object ORM unit-of-work bookkeeping: one
+        executemany statement per 1000-row page (see the engine's
+        insertmanyvalues_page_size) instead of a round trip per row.
+        """
+        session.execute(insert(cls), records)
+
 
 # Pydantic Schemas
 class CoverageDetails(BaseModel):
     """Coverage details for specific coverage type."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     coverage_type: CoverageType
     coverage_limit: Decimal = Field(..., gt=0, description="Maximum coverage amount")
     deductible: Decimal = Field(..., ge=0, description="Deductible amount")
     premium_portion: Decimal = Field(..., gt=0, description="Premium portion for this coverage")
-    exclusions: List[str] = Field(default_factory=list, description="Coverage exclusions")
-    conditions: List[str] = Field(default_factory=list, description="Special conditions")
+    exclusions: NonEmptyStrList = Field(default_factory=list, description="Coverage exclusions")
+    conditions: NonEmptyStrList = Field(default_factory=list, description="Special conditions")
 
     @field_validator('coverage_limit', 'deductible', 'premium_portion')
     @classmethod
@@ -92,70 +176,56 @@ class CoverageDetails(BaseModel):
         """Validate monetary amounts are properly formatted."""
         if v < 0:
             raise ValueError('Monetary amounts must be non-negative')
-        # Ensure no more than 2 decimal places
-        if v.as_tuple().exponent < -2:
+        if not _is_cent_precise(v):
             raise ValueError('Monetary amounts cannot have more than 2 decimal places')
         return v
 
-    @field_validator('exclusions', 'conditions')
-    @classmethod
-    def validate_text_lists(cls, v):
-        """Validate text lists contain non-empty strings."""
-        if v:
-            for item in v:
-                if not isinstance(item, str) or not item.strip():
-                    raise ValueError('List items must be non-empty strings')
-        return v
-
 
 class PolicyTerms(BaseModel):
     """Policy terms and conditions."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     coverage_details: List[CoverageDetails] = Field(..., min_length=1, description="Coverage details")
-    policy_conditions: List[str] = Field(default_factory=list, description="General policy conditions")
-    exclusions: List[str] = Field(default_factory=list, description="General exclusions")
-    claim_procedures: List[str] = Field(default_factory=list, description="Claim filing procedures")
+    policy_conditions: NonEmptyStrList = Field(default_factory=list, description="General policy conditions")
+    exclusions: NonEmptyStrList = Field(default_factory=list, description="General exclusions")
+    claim_procedures: NonEmptyStrList = Field(default_factory=list, description="Claim filing procedures")
     cancellation_terms: str = Field(..., min_length=10, description="Cancellation policy")
     renewal_terms: str = Field(..., min_length=10, description="Renewal policy")
     jurisdiction: str = Field(..., min_length=2, max_length=10, description="Legal jurisdiction")
     regulatory_compliance: Dict[str, str] = Field(default_factory=dict, description="Regulatory compliance info")
 
-    @field_validator('policy_conditions', 'exclusions', 'claim_procedures')
-    @classmethod
-    def validate_text_lists(cls, v):
-        """Validate text lists contain non-empty strings."""
-        if v:
-            for item in v:
-                if not isinstance(item, str) or not item.strip():
-                    raise ValueError('List items must be non-empty strings')
-        return v
-
     @field_validator('jurisdiction')
     @classmethod
     def validate_jurisdiction(cls, v):
         """Validate jurisdiction format."""
-        if not re.match(r'^[A-Z]{2,3}(-[A-Z]{2,3})?$', v.upper()):
+        if not _JURISDICTION_RE.match(v.upper()):
             raise ValueError('Jurisdiction must be in format like "US", "CA", "EU-DE"')
         return v.upper()
 
     @model_validator(mode='after')
     def validate_coverage_consistency(self):
-        """Validate coverage details consistency."""
-        coverage_types = [cd.coverage_type for cd in self.coverage_details]
-        
-        # Check for duplicate coverage types
-        if len(coverage_types) != len(set(coverage_types)):
-            raise ValueError('Duplicate coverage types are not allowed')
-        
-        # Validate comprehensive coverage rules
-        if CoverageType.COMPREHENSIVE in coverage_types:
-            if len(coverage_types) > 1:
-                raise ValueError('Comprehensive coverage cannot be combined with other coverage types')
-        
+        """Validate coverage details consistency.
+
+        One bitmask pass over coverage_details with no intermediate
+        list: the duplicate check short-circuits and the comprehensive
+        rule falls out of the final mask.
+        """
+        mask = 0
+        for cd in self.coverage_details:
+            bit = _COVERAGE_BITS[cd.coverage_type]
+            if mask & bit:
+                raise ValueError('Duplicate coverage types are not allowed')
+            mask |= bit
+        if mask & _COMPREHENSIVE_BIT and mask != _COMPREHENSIVE_BIT:
+            raise ValueError('Comprehensive coverage cannot be combined with other coverage types')
+
         return self
 
 
 class PolicyBase(BaseModel):
     """Base policy schema."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     robot_id: UUID = Field(..., description="Robot ID")
     customer_id: str = Field(..., min_length=1, max_length=255, description="Customer ID")
     coverage_types: List[CoverageType] = Field(..., min_length=1, description="Coverage types")
@@ -173,7 +243,7 @@ class PolicyBase(BaseModel):
     @classmethod
     def validate_customer_id(cls, v):
         """Validate customer ID format."""
-        if not re.match(r'^[A-Za-z0-9\-_]+$', v):
+        if not _CUSTOMER_ID_RE.match(v):
             raise ValueError('Customer ID must contain only alphanumeric characters, hyphens, and underscores')
         return v
 
@@ -183,7 +253,7 @@ class PolicyBase(BaseModel):
         """Validate monetary amounts."""
         if v < 0:
             raise ValueError('Monetary amounts must be non-negative')
-        if v.as_tuple().exponent < -2:
+        if not _is_cent_precise(v):
             raise ValueError('Monetary amounts cannot have more than 2 decimal places')
         return v
 
@@ -193,59 +263,53 @@ class PolicyBase(BaseModel):
         """Validate coverage types list."""
         if not v:
             raise ValueError('At least one coverage type must be specified')
-        
-        # Check for duplicates
-        if len(v) != len(set(v)):
-            raise ValueError('Duplicate coverage types are not allowed')
-        
-        # Validate comprehensive coverage rules
-        if CoverageType.COMPREHENSIVE in v and len(v) > 1:
+
+        # Duplicate and comprehensive checks in one pass over a bitmask,
+        # stopping at the first duplicate.
+        mask = 0
+        for ct in v:
+            bit = _COVERAGE_BITS[ct]
+            if mask & bit:
+                raise ValueError('Duplicate coverage types are not allowed')
+            mask |= bit
+        if mask & _COMPREHENSIVE_BIT and mask != _COMPREHENSIVE_BIT:
             raise ValueError('Comprehensive coverage cannot be combined with other coverage types')
-        
+
         return v
 
     @model_validator(mode='after')
-    def validate_policy_dates(self):
-        """Validate policy date relationships."""
-        if self.expiration_date <= self.effective_date:
+    def validate_policy(self):
+        """Validate date, deductible, and premium relationships.
+
+        Fused into a single after-validator so pydantic-core makes one
+        Python callback per instance instead of three.
+        """
+        effective_date = self.effective_date
+        expiration_date = self.expiration_date
+        coverage_limit = self.coverage_limit
+        premium_amount = self.premium_amount
+
+        if expiration_date <= effective_date:
             raise ValueError('Expiration date must be after effective date')
-        
+
         # Policy term should be reasonable (between 1 month and 5 years)
-        term_days = (self.expiration_date - self.effective_date).days
-        if term_days < 30:
+        term_days = (expiration_date - effective_date).days
+        if term_days < _MIN_TERM_DAYS:
             raise ValueError('Policy term must be at least 30 days')
-        if term_days > 1825:  # 5 years
+        if term_days > _MAX_TERM_DAYS:
             raise ValueError('Policy term cannot exceed 5 years')
-        
-        return self
 
-    @model_validator(mode='after')
-    def validate_deductible_vs_coverage(self):
-        """Validate deductible is reasonable compared to coverage limit."""
-        if self.deductible_amount > self.coverage_limit * Decimal('0.5'):
+        if self.deductible_amount > coverage_limit * _DEDUCTIBLE_CAP:
             raise ValueError('Deductible cannot exceed 50% of coverage limit')
-        
-        return self
 
-    @model_validator(mode='after')
-    def validate_premium_reasonableness(self):
-        """Validate premium is reasonable compared to coverage."""
         # Premium should not exceed 20% of coverage limit annually
-        max_premium = self.coverage_limit * Decimal('0.2')
-        if self.premium_amount > max_premium:
+        if premium_amount > coverage_limit * _PREMIUM_CAP:
             raise ValueError('Premium amount exceeds reasonable threshold (20% of coverage limit)')
-        
+
         # Minimum premium based on risk level
-        min_premiums = {
-            RiskLevel.LOW: Decimal('100'),
-            RiskLevel.MEDIUM: Decimal('250'),
-            RiskLevel.HIGH: Decimal('500'),
-            RiskLevel.CRITICAL: Decimal('1000')
-        }
-        
-        if self.premium_amount < min_premiums[self.risk_level]:
+        if premium_amount < _MIN_PREMIUMS[self.risk_level]:
             raise ValueError(f'Premium too low for {self.risk_level.value} risk level')
-        
+
         return self
 
 
@@ -253,6 +317,15 @@ class PolicyCreate(PolicyBase):
     """Schema for creating a policy."""
     underwriter_notes: Optional[str] = Field(None, max_length=2000, description="Underwriter notes")
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "PolicyCreate":
+        """Parse and validate raw JSON in one pydantic-core pass.
+
+        Prefer this over json.loads + model_validate: the payload is
+        deserialized once instead of twice.
+        """
+        return cls.model_validate_json(data)
+
     @field_validator('underwriter_notes')
     @classmethod
     def validate_underwriter_notes(cls, v):
@@ -264,6 +337,8 @@ class PolicyCreate(PolicyBase):
 
 class PolicyUpdate(BaseModel):
     """Schema for updating a policy."""
+    model_config = ConfigDict(extra='forbid')
+
     status: Optional[PolicyStatus] = None
     premium_amount: Optional[Decimal] = Field(None, gt=0)
     deductible_amount: Optional[Decimal] = Field(None, ge=0)
@@ -280,7 +355,7 @@ class PolicyUpdate(BaseModel):
         if v is not None:
             if v < 0:
                 raise ValueError('Monetary amounts must be non-negative')
-            if v.as_tuple().exponent < -2:
+            if not _is_cent_precise(v):
                 raise ValueError('Monetary amounts cannot have more than 2 decimal places')
         return v
 
@@ -295,27 +370,77 @@ class PolicyUpdate(BaseModel):
 
 class PolicyResponse(PolicyBase):
     """Schema for policy response."""
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
     id: UUID
     policy_number: str
     status: PolicyStatus
     underwriter_notes: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "PolicyResponse":
+        """Build a response from a trusted ORM row without re-validation.
+
+        Database rows were validated on the way in, so paginated list
+        reads can skip the per-field validator chain via model_construct.
+        Never use this for external input.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
+
+
+# Serialized-policy cache keyed by (id, updated_at): an untouched row
+# always serializes to the same bytes, so repeatedly listed pages reuse
+# the previous dump instead of re-walking every field. Any update bumps
+# updated_at, which naturally invalidates the entry.
+_POLICY_JSON_CACHE: Dict[tuple, bytes] = {}
+_POLICY_JSON_CACHE_MAX = 4096
+
+
+def policy_response_json(policy: PolicyResponse) -> bytes:
+    """Serialize a PolicyResponse, reusing cached bytes when unchanged."""
+    key = (policy.id, policy.updated_at)
+    cached = _POLICY_JSON_CACHE.get(key)
+    if cached is None:
+        if len(_POLICY_JSON_CACHE) >= _POLICY_JSON_CACHE_MAX:
+            _POLICY_JSON_CACHE.clear()
+        cached = _POLICY_JSON_CACHE[key] = policy.model_dump_json().encode()
+    return cached
 
 
 class PolicyListResponse(BaseModel):
     """Schema for policy list response."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     policies: List[PolicyResponse]
     total: int
     page: int
     size: int
 
+    def json_bytes(self) -> bytes:
+        """Render the full response body from per-policy cached dumps.
+
+        Endpoints can return this via a raw Response to skip re-running
+        the pydantic serializer over policies already dumped for an
+        earlier page view.
+        """
+        return b''.join((
+            b'{"policies":[',
+            b','.join(policy_response_json(p) for p in self.policies),
+            b'],"total":', str(self.total).encode(),
+            b',"page":', str(self.page).encode(),
+            b',"size":', str(self.size).encode(),
+            b'}',
+        ))
+
 
 class PolicyQuoteRequest(BaseModel):
     """Schema for policy quote request."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     robot_id: UUID = Field(..., description="Robot ID")
     customer_id: str = Field(..., min_length=1, max_length=255)
     coverage_types: List[CoverageType] = Field(..., min_length=1)
@@ -324,17 +449,30 @@ class PolicyQuoteRequest(BaseModel):
     policy_term_months: int = Field(..., ge=1, le=60, description="Policy term in months")
     payment_frequency: PaymentFrequency = Field(default=PaymentFrequency.ANNUAL)
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "PolicyQuoteRequest":
+        """Parse and validate raw quote JSON in one pydantic-core pass."""
+        return cls.model_validate_json(data)
+
     @field_validator('coverage_types')
     @classmethod
     def validate_coverage_types(cls, v):
         """Validate coverage types for quote."""
-        if CoverageType.COMPREHENSIVE in v and len(v) > 1:
+        mask = 0
+        for ct in v:
+            bit = _COVERAGE_BITS[ct]
+            if mask & bit:
+                raise ValueError('Duplicate coverage types are not allowed')
+            mask |= bit
+        if mask & _COMPREHENSIVE_BIT and mask != _COMPREHENSIVE_BIT:
             raise ValueError('Comprehensive coverage cannot be combined with other coverage types')
         return v
 
 
 class PolicyQuoteResponse(BaseModel):
     """Schema for policy quote response."""
+    model_config = ConfigDict(from_attributes=True, extra='ignore', frozen=True)
+
     quote_id: UUID = Field(default_factory=uuid4)
     robot_id: UUID
     customer_id: str
@@ -346,13 +484,23 @@ class PolicyQuoteResponse(BaseModel):
     risk_factors: List[str]
     quote_valid_until: datetime
     terms_summary: Dict[str, Any]
-    
-    class Config:
-        from_attributes = True
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "PolicyQuoteResponse":
+        """Build a quote response from trusted quote-engine output.
+
+        The quote engine produces already-validated values, so
+        model_construct skips the validator graph entirely. Never use
+        this for external input.
+        """
+        data.setdefault('quote_id', uuid4())
+        return cls.model_construct(**data)
 
 
 class PolicyRenewalRequest(BaseModel):
     """Schema for policy renewal request."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     policy_id: UUID
     new_expiration_date: date
     premium_adjustment: Optional[Decimal] = Field(None, description="Premium adjustment amount")
@@ -360,15 +508,22 @@ class PolicyRenewalRequest(BaseModel):
     terms_updates: Optional[PolicyTerms] = None
 
     @model_validator(mode='after')
-    def validate_renewal_date(self):
-        """Validate renewal date is in the future."""
-        if self.new_expiration_date <= date.today():
+    def validate_renewal_date(self, info: ValidationInfo):
+        """Validate renewal date is in the future.
+
+        Bulk callers can pass context={'today': ...} so N requests share
+        one clock read instead of calling date.today() per instance.
+        """
+        today = (info.context or {}).get('today') or date.today()
+        if self.new_expiration_date <= today:
             raise ValueError('Renewal expiration date must be in the future')
         return self
 
 
 class PolicyCancellationRequest(BaseModel):
     """Schema for policy cancellation request."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     policy_id: UUID
     cancellation_date: date
     reason: str = Field(..., min_length=10, max_length=500)
@@ -383,8 +538,21 @@ class PolicyCancellationRequest(BaseModel):
         return v.strip()
 
     @model_validator(mode='after')
-    def validate_cancellation_date(self):
-        """Validate cancellation date."""
-        if self.cancellation_date < date.today():
+    def validate_cancellation_date(self, info: ValidationInfo):
+        """Validate cancellation date.
+
+        Accepts an injected 'today' via validation context, matching the
+        renewal-date validator.
+        """
+        today = (info.context or {}).get('today') or date.today()
+        if self.cancellation_date < today:
             raise ValueError('Cancellation date cannot be in the past')
-        return self
\ No newline at end of file
+        return self
+
+
+# Shared TypeAdapters, instantiated once so hot request decoding and
+# serialization paths reuse the same compiled validator/serializer
+# instead of rebuilding per call.
+POLICY_CREATE_ADAPTER = TypeAdapter(PolicyCreate)
+POLICY_RESPONSE_ADAPTER = TypeAdapter(PolicyResponse)
+POLICY_QUOTE_REQUEST_ADAPTER = TypeAdapter(PolicyQuoteRequest)
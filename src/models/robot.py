@@ -6,11 +6,17 @@ from typing import Dict, Any, Optional
 from uuid import UUID, uuid4
 import re
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from sqlalchemy import Column, String, DateTime, JSON, Text, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from sqlalchemy import Column, String, DateTime, JSON, Text, CheckConstraint, Index, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from src.core.database import Base
+from src.models.types import NonEmptyStrList
+
+# Validator patterns, compiled once at import instead of through re's
+# per-call cache lookup.
+_SERIAL_RE = re.compile(r'^[A-Z0-9\-]+$')
+_ID_RE = re.compile(r'^[A-Za-z0-9\-_]+$')
 
 
 class RobotType(str, Enum):
@@ -50,21 +56,57 @@ class Robot(Base):
     manufacturer_id = Column(String(255), nullable=False)
     model = Column(String(255), nullable=False)
     serial_number = Column(String(255), unique=True, nullable=False)
-    robot_type = Column(SQLEnum(RobotType), nullable=False)
-    status = Column(SQLEnum(RobotStatus), default=RobotStatus.ACTIVE)
-    usage_scenario = Column(SQLEnum(UsageScenario), nullable=False)
-    specifications = Column(JSON, nullable=False)
+    # Enum-valued columns are stored as plain strings with DB-level CHECK
+    # constraints, skipping SQLAlchemy's per-row enum conversion on fetch;
+    # the Pydantic response schemas coerce back to Enum members.
+    robot_type = Column(String(32), nullable=False)
+    status = Column(String(32), default=RobotStatus.ACTIVE.value)
+    usage_scenario = Column(String(32), nullable=False)
+    specifications = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
     owner_id = Column(String(255), nullable=False)
     registration_date = Column(DateTime, default=datetime.utcnow)
     last_diagnostic_date = Column(DateTime, nullable=True)
-    diagnostic_data = Column(JSON, nullable=True)
+    diagnostic_data = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        CheckConstraint(
+            "robot_type IN ('humanoid','industrial','service','companion','medical')",
+            name='ck_robots_robot_type',
+        ),
+        CheckConstraint(
+            "status IN ('active','inactive','maintenance','decommissioned')",
+            name='ck_robots_status',
+        ),
+        CheckConstraint(
+            "usage_scenario IN ('domestic','commercial','industrial','healthcare','education','research')",
+            name='ck_robots_usage_scenario',
+        ),
+        # Fleet listings filter by owner or manufacturer, and the status
+        # dashboards group by status within a robot type.
+        Index('ix_robots_owner_id', 'owner_id'),
+        Index('ix_robots_manufacturer_id', 'manufacturer_id'),
+        Index('ix_robots_status_type', 'status', 'robot_type'),
+    )
+
+    @classmethod
+    def bulk_insert(cls, session, records: list[Dict[str, Any]]) -> None:
+        """Insert many robot rows through insertmanyvalues.
+
+        One executemany statement per 1000-row page instead of a round
+        trip per row; see Policy.bulk_insert.
+        """
+        session.execute(insert(cls), records)
+
 
 # Pydantic Schemas
 class RobotSpecifications(BaseModel):
     """Robot technical specifications."""
+    # Not frozen: callers build a spec then tweak individual readings
+    # before attaching it to a robot, so this one stays mutable.
+    model_config = ConfigDict(extra='forbid')
+
     height_cm: float = Field(..., gt=0, le=300, description="Robot height in centimeters")
     weight_kg: float = Field(..., gt=0, le=1000, description="Robot weight in kilograms")
     max_speed_kmh: float = Field(..., ge=0, le=50, description="Maximum speed in km/h")
@@ -72,33 +114,29 @@ class RobotSpecifications(BaseModel):
     operating_temperature_min: float = Field(..., ge=-40, le=85, description="Minimum operating temperature in Celsius")
     operating_temperature_max: float = Field(..., ge=-40, le=85, description="Maximum operating temperature in Celsius")
     ip_rating: str = Field(..., pattern=r"^IP[0-9X][0-9X]$", description="IP rating for dust and water resistance")
-    certifications: list[str] = Field(default_factory=list, description="Safety certifications")
-    sensors: list[str] = Field(default_factory=list, description="List of sensors")
-    actuators: list[str] = Field(default_factory=list, description="List of actuators")
-    ai_capabilities: list[str] = Field(default_factory=list, description="AI and ML capabilities")
-    connectivity: list[str] = Field(default_factory=list, description="Connectivity options")
+    certifications: NonEmptyStrList = Field(default_factory=list, description="Safety certifications")
+    sensors: NonEmptyStrList = Field(default_factory=list, description="List of sensors")
+    actuators: NonEmptyStrList = Field(default_factory=list, description="List of actuators")
+    ai_capabilities: NonEmptyStrList = Field(default_factory=list, description="AI and ML capabilities")
+    connectivity: NonEmptyStrList = Field(default_factory=list, description="Connectivity options")
 
-    @field_validator('operating_temperature_max')
-    @classmethod
-    def validate_temperature_range(cls, v, info):
-        """Validate that max temperature is greater than min temperature."""
-        if info.data and 'operating_temperature_min' in info.data and v <= info.data['operating_temperature_min']:
+    @model_validator(mode='after')
+    def validate_temperature_range(self):
+        """Validate that max temperature is greater than min temperature.
+
+        Runs after field validation so both bounds are plain attribute
+        reads; the field-validator form forced pydantic-core to build an
+        info.data side dict just for this comparison.
+        """
+        if self.operating_temperature_max <= self.operating_temperature_min:
             raise ValueError('Maximum operating temperature must be greater than minimum operating temperature')
-        return v
-
-    @field_validator('certifications', 'sensors', 'actuators', 'ai_capabilities', 'connectivity')
-    @classmethod
-    def validate_non_empty_strings(cls, v):
-        """Validate that list items are non-empty strings."""
-        if v:
-            for item in v:
-                if not isinstance(item, str) or not item.strip():
-                    raise ValueError('List items must be non-empty strings')
-        return v
+        return self
 
 
 class DiagnosticData(BaseModel):
     """Robot diagnostic data."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     timestamp: datetime
     battery_level: float = Field(..., ge=0, le=100, description="Battery level percentage")
     temperature: float = Field(..., description="Operating temperature in Celsius")
@@ -111,6 +149,8 @@ class DiagnosticData(BaseModel):
 
 class RobotBase(BaseModel):
     """Base robot schema."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     manufacturer_id: str = Field(..., min_length=1, max_length=255)
     model: str = Field(..., min_length=1, max_length=255)
     serial_number: str = Field(..., min_length=1, max_length=255)
@@ -123,7 +163,7 @@ class RobotBase(BaseModel):
     @classmethod
     def validate_serial_number(cls, v):
         """Validate serial number format (alphanumeric with hyphens)."""
-        if not re.match(r'^[A-Z0-9\-]+$', v.upper()):
+        if not _SERIAL_RE.match(v.upper()):
             raise ValueError('Serial number must contain only alphanumeric characters and hyphens')
         return v.upper()
 
@@ -131,7 +171,7 @@ class RobotBase(BaseModel):
     @classmethod
     def validate_ids(cls, v):
         """Validate ID format (no special characters except hyphens and underscores)."""
-        if not re.match(r'^[A-Za-z0-9\-_]+$', v):
+        if not _ID_RE.match(v):
             raise ValueError('ID must contain only alphanumeric characters, hyphens, and underscores')
         return v
 
@@ -166,11 +206,17 @@ class RobotBase(BaseModel):
 
 class RobotCreate(RobotBase):
     """Schema for creating a robot."""
-    pass
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "RobotCreate":
+        """Parse and validate raw JSON in one pydantic-core pass."""
+        return cls.model_validate_json(data)
 
 
 class RobotUpdate(BaseModel):
     """Schema for updating a robot."""
+    model_config = ConfigDict(extra='forbid')
+
     status: Optional[RobotStatus] = None
     usage_scenario: Optional[UsageScenario] = None
     specifications: Optional[RobotSpecifications] = None
@@ -179,6 +225,8 @@ class RobotUpdate(BaseModel):
 
 class RobotResponse(RobotBase):
     """Schema for robot response."""
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
     id: UUID
     status: RobotStatus
     registration_date: datetime
@@ -186,14 +234,20 @@ class RobotResponse(RobotBase):
     diagnostic_data: Optional[DiagnosticData] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class RobotListResponse(BaseModel):
     """Schema for robot list response."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     robots: list[RobotResponse]
     total: int
     page: int
-    size: int
\ No newline at end of file
+    size: int
+
+
+# Shared TypeAdapters, instantiated once so hot request decoding and
+# serialization paths reuse the same compiled validator/serializer
+# instead of rebuilding per call.
+ROBOT_CREATE_ADAPTER = TypeAdapter(RobotCreate)
+ROBOT_RESPONSE_ADAPTER = TypeAdapter(RobotResponse)
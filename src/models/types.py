@@ -0,0 +1,19 @@
+"""Annotated field types shared across the entity schemas."""
+
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def _all_nonempty_strings(v: list[str]) -> list[str]:
+    """Reject lists containing empty or whitespace-only strings."""
+    for item in v:
+        if not isinstance(item, str) or not item.strip():
+            raise ValueError('List items must be non-empty strings')
+    return v
+
+
+# Carrying the check in the annotated type registers a single validator
+# function with pydantic-core instead of one classmethod dispatch per
+# field per model.
+NonEmptyStrList = Annotated[list[str], AfterValidator(_all_nonempty_strings)]
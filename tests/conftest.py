@@ -59,4 +59,37 @@ def client(db_session):
     app.dependency_overrides[get_db] = lambda: db_session
     with TestClient(app) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Create a shared test client without database overrides.
+
+    Session-scoped so lifespan startup/shutdown runs once instead of per
+    test; suitable for stateless endpoints that never touch the DB
+    session dependency.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def has_msg(exc_info, text):
+    """Check a ValidationError for a message substring via errors().
+
+    str(ValidationError) re-renders the entire error tree on every call,
+    which is wasteful for assertions against deeply nested models;
+    errors() returns the already-built error dicts directly.
+    """
+    errors = exc_info.value.errors(include_url=False, include_input=False)
+    return any(text in error["msg"] for error in errors)
+
+
+def has_loc(exc_info, field):
+    """Check a ValidationError for a failing field by location.
+
+    Like has_msg, this reads the structured errors() output instead of
+    rendering the full error string just to find a field name in it.
+    """
+    errors = exc_info.value.errors(include_url=False, include_input=False)
+    return any(field in error["loc"] for error in errors)
